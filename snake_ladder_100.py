@@ -22,6 +22,12 @@ SNAKES: Dict[int, int] = {
 }
 TARGET = 100
 
+# REDIRECT[i] is where a token landing on square i ends up (i itself if plain).
+# A plain list: one lookup at a time is faster than indexing a NumPy array.
+REDIRECT: List[int] = list(range(TARGET + 1))
+for _start, _end in {**SNAKES, **LADDERS}.items():
+    REDIRECT[_start] = _end
+
 class Player:
     def __init__(self, name: str) -> None:
         self.name = name
@@ -31,19 +37,19 @@ class Player:
         return f"Player(name={self.name!r}, pos={self.pos})"
 
 
-def roll_dice() -> int:
-    return random.randint(1, 6)
+# Globals are bound as default arguments so the per-turn lookups are locals
+def roll_dice(_randint=random.randint) -> int:
+    return _randint(1, 6)
 
 
-def apply_snakes_ladders(position: int) -> int:
+def apply_snakes_ladders(position: int, _redirect=REDIRECT) -> int:
     # If landing on a ladder bottom, climb; if on snake head, slide down
-    if position in LADDERS:
-        print(f"  🎉 Ladder! Climb from {position} to {LADDERS[position]}.")
-        return LADDERS[position]
-    if position in SNAKES:
-        print(f"  🐍 Snake! Slide from {position} to {SNAKES[position]}.")
-        return SNAKES[position]
-    return position
+    dest = _redirect[position]
+    if dest > position:
+        print(f"  🎉 Ladder! Climb from {position} to {dest}.")
+    elif dest < position:
+        print(f"  🐍 Snake! Slide from {position} to {dest}.")
+    return dest
 
 
 def turn_step(player: Player) -> bool:
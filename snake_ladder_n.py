@@ -10,12 +10,22 @@ Usage examples:
   python3 snake_ladder_nxn.py --size 12       # default N=12 in prompt (you can override there)
   python3 snake_ladder_nxn.py --players "You,Alice,Computer 1"
   python3 snake_ladder_nxn.py --overshoot bounce --cascade --seed 42
+  python3 snake_ladder_nxn.py --headless --players "Computer 1,Computer 2,Computer 3"
+
+The pure game rules are also available headless through `simulate`, a
+Numba-compiled Monte-Carlo run for fairness / game-length analysis;
+`run_batch` wraps it with board setup for scripted use.
+
+Requires NumPy and Numba (pip install numpy numba).
 """
 from __future__ import annotations
 import argparse
 import random
 from typing import Dict, List, Tuple, Set
 
+import numba
+import numpy as np
+
 DEFAULT_LADDERS_10x10 = {
     2: 38, 7: 14, 8: 31, 15: 26, 21: 42,
     28: 84, 36: 44, 51: 67, 71: 91, 78: 98
@@ -25,14 +35,15 @@ DEFAULT_SNAKES_10x10 = {
     74: 53, 89: 68, 92: 88, 95: 75, 99: 80
 }
 
+# Batch random stream (PCG64) for NumPy-side draws; build_board reseeds
+# it when given a seed. Single dice rolls stay on random.randint.
+_rng = np.random.default_rng()
+
 class Player:
     def __init__(self, name: str) -> None:
         self.name = name
         self.pos = 0
-
-    @property
-    def is_bot(self) -> bool:
-        return self.name.lower().startswith('computer')
+        self.is_bot = name.lower().startswith('computer')
 
     def __repr__(self) -> str:
         return f"Player(name={self.name!r}, pos={self.pos})"
@@ -50,125 +61,300 @@ def parse_args() -> argparse.Namespace:
     p.add_argument('--overshoot', choices=['stay', 'bounce'], default='stay',
                    help="Overshoot behavior: 'stay' (default) or 'bounce' back from the end")
     p.add_argument('--cascade', action='store_true', help='Apply snakes/ladders repeatedly (chain effects)')
-    return p.parse_args()
+    p.add_argument('--headless', action='store_true',
+                   help='No prompts: play the whole match at once, then print the transcript')
+    args = p.parse_args()
+    # Headless mode skips prompt_players, so enforce its two-player rule here
+    if args.headless and len([n for n in args.players.split(',') if n.strip()]) < 2:
+        p.error('--headless needs at least two names in --players')
+    return args
 
 
-def roll_dice(sides: int = 6) -> int:
-    return random.randint(1, sides)
+# random.randint is bound as a default argument so each roll is a local lookup
+def roll_dice(sides: int = 6, _randint=random.randint) -> int:
+    return _randint(1, sides)
 
 
 def generate_snakes_ladders(target: int, n: int, snakes: int, ladders: int,
                              avoid: Set[int] = None) -> Tuple[Dict[int, int], Dict[int, int]]:
-    avoid = set(avoid or [])
-    avoid.update({1, target})
-
     S: Dict[int, int] = {}
     L: Dict[int, int] = {}
-    used_starts: Set[int] = set()
-    used_ends: Set[int] = set()
-
-    def add_pair(is_ladder: bool) -> bool:
-        tries = 0
-        while tries < 5000:
-            tries += 1
-            start = random.randint(2, target - 1)
-            if start in avoid or start in used_starts:
-                continue
+    # Per-square bitmaps, so membership tests work on whole candidate arrays
+    blocked = np.zeros(target + 1, dtype=bool)
+    blocked[list(avoid or [])] = True
+    blocked[[1, target]] = True
+    used_starts = np.zeros(target + 1, dtype=bool)
+    used_ends = np.zeros(target + 1, dtype=bool)
+    ladder_ends = np.zeros(target + 1, dtype=bool)
+    min_gap = max(2, n // 2)
+
+    def add_pairs(out: Dict[int, int], count: int, is_ladder: bool) -> None:
+        # Draw candidates in batches and filter them with boolean masks;
+        # the same 5000-draws-per-pair budget as a one-at-a-time search.
+        budget = 5000 * count
+        while len(out) < count and budget > 0:
+            size = min(budget, 8 * (count - len(out)))
+            budget -= size
+            starts = _rng.integers(2, target, size=size)
             if is_ladder:
-                end = random.randint(start + 1, target - 1)
+                lo, hi = starts + 1, np.full(size, target)
             else:
-                end = random.randint(2, start - 1)
-            if end in avoid or end in used_ends:
-                continue
-            if abs(end - start) < max(2, n // 2):
-                continue
-            if is_ladder:
-                if end in used_starts or end in used_ends:
-                    continue
-                if end in S.keys():
+                lo, hi = np.full(size, 2), starts
+            ok = lo < hi
+            ends = _rng.integers(lo, np.where(ok, hi, lo + 1))
+            ok &= ~blocked[starts] & ~used_starts[starts]
+            ok &= ~blocked[ends] & ~used_ends[ends] & ~used_starts[ends]
+            ok &= np.abs(ends - starts) >= min_gap
+            if not is_ladder:
+                ok &= ~ladder_ends[starts]
+            # Survivors may still clash with each other within the batch
+            for start, end in zip(starts[ok].tolist(), ends[ok].tolist()):
+                if len(out) == count:
+                    break
+                if used_starts[start] or used_starts[end] or used_ends[end]:
                     continue
-                L[start] = end
-                used_starts.add(start)
-                used_ends.add(end)
-                return True
-            else:
-                if end in used_starts or end in used_ends:
+                if not is_ladder and ladder_ends[start]:
                     continue
-                if start in L.values():
-                    continue
-                S[start] = end
-                used_starts.add(start)
-                used_ends.add(end)
-                return True
-        return False
-
-    ladder_quota = ladders
-    snake_quota = snakes
-    toggle = True
-    while ladder_quota > 0 or snake_quota > 0:
-        if toggle and ladder_quota > 0:
-            if add_pair(is_ladder=True):
-                ladder_quota -= 1
-            else:
-                break
-        elif (not toggle) and snake_quota > 0:
-            if add_pair(is_ladder=False):
-                snake_quota -= 1
-            else:
-                break
-        toggle = not toggle
-
+                out[start] = end
+                used_starts[start] = True
+                used_ends[end] = True
+                if is_ladder:
+                    ladder_ends[end] = True
+
+    add_pairs(L, ladders, is_ladder=True)
+    add_pairs(S, snakes, is_ladder=False)
     return S, L
 
 
-def apply_snake_ladder(pos: int, snakes: Dict[int, int], ladders: Dict[int, int], cascade: bool=False) -> int:
-    if not cascade:
-        if pos in ladders:
-            print(f"  🎉 Ladder! {pos} → {ladders[pos]}")
-            return ladders[pos]
-        if pos in snakes:
-            print(f"  🐍 Snake! {pos} → {snakes[pos]}")
-            return snakes[pos]
+def build_redirect(target: int, snakes: Dict[int, int], ladders: Dict[int, int],
+                   cascade: bool = False) -> np.ndarray:
+    """Lookup table where entry i is the square a token on i is moved to.
+
+    With `cascade`, chains of snakes/ladders are followed to their final
+    square here, so a turn never needs more than one lookup.
+    """
+    jumps = {**snakes, **ladders}
+    redirect = np.arange(target + 1, dtype=np.int32)
+    for start, end in jumps.items():
+        if cascade:
+            seen = {start}
+            while end in jumps and end not in seen:
+                seen.add(end)
+                end = jumps[end]
+        redirect[start] = end
+    return redirect
+
+
+def apply_snake_ladder(pos: int, redirect: List[int]) -> int:
+    # Only squares on the board may index the table; NumPy would wrap negatives
+    if not 0 <= pos < len(redirect):
         return pos
-    current = pos
-    while True:
-        moved = False
-        if current in ladders:
-            nxt = ladders[current]
-            print(f"  🎉 Ladder! {current} → {nxt}")
-            current = nxt
-            moved = True
-        elif current in snakes:
-            nxt = snakes[current]
-            print(f"  🐍 Snake! {current} → {nxt}")
-            current = nxt
-            moved = True
-        if not moved:
-            return current
+    dest = redirect[pos]
+    if dest > pos:
+        print(f"  🎉 Ladder! {pos} → {dest}")
+    elif dest < pos:
+        print(f"  🐍 Snake! {pos} → {dest}")
+    return dest
+
+
+OVERSHOOT_MODES = {'stay': 0, 'bounce': 1}
+
+
+def overshoot_square(curr, roll, target, overshoot_mode):
+    """Square reached from `curr` by `roll`, before snakes/ladders apply.
+
+    A bounce reflects off both ends of the board, so even a die with more
+    faces than the board has squares lands somewhere in [0, target].
+    """
+    pos = curr + roll
+    if pos <= target:
+        return pos
+    if overshoot_mode == 0:
+        return curr
+    pos %= 2 * target
+    if pos > target:
+        pos = 2 * target - pos
+    return pos
+
+
+# Same rule compiled for the kernels; interactive play calls the Python one
+overshoot_square_jit = numba.njit(cache=True)(overshoot_square)
 
 
 def overshoot_move(curr: int, roll: int, target: int, mode: str) -> int:
     tentative = curr + roll
-    if tentative == target:
-        return target
-    if tentative < target:
+    if tentative <= target:
         return tentative
     if mode == 'stay':
         print(f"  Needs exact roll to reach {target}. Stay at {curr}.")
         return curr
-    over = tentative - target
-    bounced = target - over
+    bounced = overshoot_square(curr, roll, target, OVERSHOOT_MODES[mode])
     print(f"  Overshoot! Bounce from {target} to {bounced}.")
     return bounced
 
 
-def turn_step(player, target, dice_sides, snakes, ladders, overshoot_mode, cascade):
+def pairs_to_array(mapping: Dict[int, int]) -> np.ndarray:
+    """Pack a {start: end} mapping into an (k, 2) int32 array for `simulate`."""
+    arr = np.empty((len(mapping), 2), dtype=np.int32)
+    for i, (start, end) in enumerate(sorted(mapping.items())):
+        arr[i, 0] = start
+        arr[i, 1] = end
+    return arr
+
+
+def check_sim_args(n_players: int, dice_sides: int) -> None:
+    # The kernels loop until someone wins and cannot be interrupted, so
+    # arguments that make a win impossible must be rejected up front
+    if n_players < 1:
+        raise ValueError(f"n_players must be at least 1, got {n_players}")
+    if dice_sides < 1:
+        raise ValueError(f"dice_sides must be at least 1, got {dice_sides}")
+
+
+def simulate(n_games, board_size, snakes_arr, ladders_arr, n_players, dice_sides,
+             overshoot_mode, cascade=False, seed=-1):
+    """Play `n_games` bot-only games without any I/O.
+
+    `overshoot_mode` is a value from OVERSHOOT_MODES. Returns two int32
+    arrays: the winning player index and the number of rounds per game.
+    """
+    check_sim_args(n_players, dice_sides)
+    target = board_size * board_size
+    snakes = dict(np.asarray(snakes_arr).reshape(-1, 2).tolist())
+    ladders = dict(np.asarray(ladders_arr).reshape(-1, 2).tolist())
+    redirect = build_redirect(target, snakes, ladders, cascade=cascade)
+    return simulate_redirect(n_games, redirect, n_players, dice_sides, overshoot_mode, seed)
+
+
+@numba.njit(cache=True)
+def simulate_redirect(n_games, redirect, n_players, dice_sides, overshoot_mode, seed=-1):
+    """Numba kernel behind `simulate`, for a table built by build_redirect."""
+    if seed >= 0:
+        np.random.seed(seed)
+    target = redirect.shape[0] - 1
+
+    winners = np.empty(n_games, dtype=np.int32)
+    rounds = np.empty(n_games, dtype=np.int32)
+    positions = np.zeros(n_players, dtype=np.int32)
+    for g in range(n_games):
+        positions[:] = 0
+        winner = -1
+        r = 0
+        while winner < 0:
+            r += 1
+            for p in range(n_players):
+                roll = np.random.randint(1, dice_sides + 1)
+                pos = redirect[overshoot_square_jit(positions[p], roll, target, overshoot_mode)]
+                positions[p] = pos
+                if pos == target:
+                    winner = p
+                    break
+        winners[g] = winner
+        rounds[g] = r
+    return winners, rounds
+
+
+def build_board(N: int, snakes_count: int = None, ladders_count: int = None,
+                cascade: bool = False, seed: int = None
+                ) -> Tuple[int, np.ndarray, Dict[int, int], Dict[int, int]]:
+    """Set up an N×N board without any prompts.
+
+    Uses the classic layout for a 10×10 board unless counts are given,
+    otherwise generates one. Returns (target, redirect, snakes, ladders).
+    """
+    global _rng
+    if seed is not None:
+        # NumPy only takes non-negative seeds; random.seed accepts any int,
+        # so negatives are wrapped to keep every --seed value usable
+        _rng = np.random.default_rng(seed % 2**64)
+    target = N * N
+    if N == 10 and snakes_count is None and ladders_count is None:
+        snakes = dict(DEFAULT_SNAKES_10x10)
+        ladders = dict(DEFAULT_LADDERS_10x10)
+    else:
+        snakes_count = snakes_count if snakes_count is not None else max(5, N)
+        ladders_count = ladders_count if ladders_count is not None else max(5, N)
+        avoid = {2, 3, target-1, target-2}
+        snakes, ladders = generate_snakes_ladders(target, N, snakes_count, ladders_count, avoid=avoid)
+    redirect = build_redirect(target, snakes, ladders, cascade=cascade)
+    return target, redirect, snakes, ladders
+
+
+def run_batch(n_games: int, size: int = 10, n_players: int = 2, snakes: int = None,
+              ladders: int = None, dice_sides: int = 6, overshoot: str = 'stay',
+              cascade: bool = False, seed: int = None) -> Tuple[np.ndarray, np.ndarray]:
+    """Monte-Carlo entry point: build one board, then play `n_games` on it.
+
+    Skips argparse, prompts and the board printout. Returns the winner
+    index and round count of every game, as from `simulate`.
+    """
+    check_sim_args(n_players, dice_sides)
+    _, redirect, _, _ = build_board(size, snakes, ladders, cascade=cascade, seed=seed)
+    kernel_seed = int(_rng.integers(2**31))
+    return simulate_redirect(n_games, redirect, n_players, dice_sides,
+                             OVERSHOOT_MODES[overshoot], kernel_seed)
+
+
+@numba.njit(cache=True)
+def play_match(redirect, n_players, dice_sides, overshoot_mode, seed):
+    """Play one bot-only match and record every turn.
+
+    Returns an int32 array with one (player, roll, pre, post) row per
+    turn; the last row is the winning move.
+    """
+    np.random.seed(seed)
+    target = redirect.shape[0] - 1
+    log = np.empty((256, 4), dtype=np.int32)
+    positions = np.zeros(n_players, dtype=np.int32)
+    n = 0
+    while True:
+        for p in range(n_players):
+            roll = np.random.randint(1, dice_sides + 1)
+            pre = positions[p]
+            post = redirect[overshoot_square_jit(pre, roll, target, overshoot_mode)]
+            positions[p] = post
+            if n == log.shape[0]:
+                grown = np.empty((2 * n, 4), dtype=np.int32)
+                grown[:n] = log
+                log = grown
+            log[n, 0] = p
+            log[n, 1] = roll
+            log[n, 2] = pre
+            log[n, 3] = post
+            n += 1
+            if post == target:
+                return log[:n]
+
+
+def print_transcript(log: np.ndarray, names: List[str], target: int, overshoot_mode: str) -> None:
+    # Rebuild the per-turn messages of turn_step from each logged row
+    mode = OVERSHOOT_MODES[overshoot_mode]
+    lines = []
+    for p, roll, pre, post in log.tolist():
+        name = names[p]
+        lines.append(f"  🎲 {name} rolled a {roll}.")
+        mid = overshoot_square(pre, roll, target, mode)
+        if mid != pre + roll:
+            if mode == 0:
+                lines.append(f"  Needs exact roll to reach {target}. Stay at {pre}.")
+            else:
+                lines.append(f"  Overshoot! Bounce from {target} to {mid}.")
+        if post > mid:
+            lines.append(f"  🎉 Ladder! {mid} → {post}")
+        elif post < mid:
+            lines.append(f"  🐍 Snake! {mid} → {post}")
+        lines.append(f"  {name} moves to {post}.")
+    print("\n".join(lines))
+    print(f"\n🏁 {names[log[-1, 0]]} wins! 🏆")
+
+
+def turn_step(player, target, dice_sides, redirect, overshoot_mode):
     if not player.is_bot:
         input(f"\n{player.name}, press Enter to roll the dice… ")
     d = roll_dice(dice_sides)
     print(f"  🎲 {player.name} rolled a {d}.")
     tentative = overshoot_move(player.pos, d, target, overshoot_mode)
-    new_pos = apply_snake_ladder(tentative, snakes, ladders, cascade=cascade)
+    new_pos = apply_snake_ladder(tentative, redirect)
     player.pos = new_pos
     print(f"  {player.name} moves to {player.pos}.")
     if player.pos == target:
@@ -206,26 +392,24 @@ def prompt_players(default_csv: str) -> List[str]:
 def main():
     args = parse_args()
 
+    # Dice rolls use random; build_board seeds the NumPy stream itself
     if args.seed is not None:
         random.seed(args.seed)
 
-    # Interactive prompts to ASK for N and player names
-    print("\n=== Snake & Ladder — Interactive Setup ===")
-    N = prompt_int("Enter board size N (N×N board, N ≥ 2)", default=max(2, args.size), min_value=2)
-    names = prompt_players(args.players)
+    if args.headless:
+        N = max(2, args.size)
+        names = [n.strip() for n in args.players.split(',') if n.strip()]
+    else:
+        # Interactive prompts to ASK for N and player names
+        print("\n=== Snake & Ladder — Interactive Setup ===")
+        N = prompt_int("Enter board size N (N×N board, N ≥ 2)", default=max(2, args.size), min_value=2)
+        names = prompt_players(args.players)
 
-    target = N * N
     players = [Player(n) for n in names]
 
     # Snakes & Ladders setup
-    if N == 10 and args.snakes is None and args.ladders is None:
-        snakes = dict(DEFAULT_SNAKES_10x10)
-        ladders = dict(DEFAULT_LADDERS_10x10)
-    else:
-        snakes_count = args.snakes if args.snakes is not None else max(5, N)
-        ladders_count = args.ladders if args.ladders is not None else max(5, N)
-        avoid = {2, 3, target-1, target-2}
-        snakes, ladders = generate_snakes_ladders(target, N, snakes_count, ladders_count, avoid=avoid)
+    target, redirect, snakes, ladders = build_board(N, args.snakes, args.ladders,
+                                                    cascade=args.cascade, seed=args.seed)
 
     # Banner
     print("\n=== Snake & Ladder (CLI) — N×N Board ===")
@@ -249,11 +433,18 @@ def main():
 
     print("\nRules: exact roll required to finish (or bounce if enabled). Good luck!\n")
 
-    # Game loop
+    if args.headless:
+        seed = int(_rng.integers(2**31))
+        log = play_match(redirect, len(players), args.dice_sides, OVERSHOOT_MODES[args.overshoot], seed)
+        print_transcript(log, names, target, args.overshoot)
+        return
+
+    # Game loop; single lookups from Python are faster on a list than on the array
+    redirect = redirect.tolist()
     winner = None
     while not winner:
         for p in players:
-            if turn_step(p, target, args.dice_sides, snakes, ladders, args.overshoot, args.cascade):
+            if turn_step(p, target, args.dice_sides, redirect, args.overshoot):
                 winner = p
                 break
 
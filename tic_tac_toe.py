@@ -1,35 +1,53 @@
+import sys
+
 
 class Player:
-    def __init__(self, name, symbol):
+    def __init__(self, name, symbol, code):
         self.name = name
         self.symbol = symbol
+        # Small integer stored in the board grid for this player's marks
+        self.code = code
 
 
 class Board:
     def __init__(self, size):
         self.size = size
-        self.grid = [[" " for _ in range(size)] for _ in range(size)]
+        # Flat row-major cells: 0 marks an empty cell, otherwise the owning player's code
+        self.grid = bytearray(size * size)
+        # Lookup from player code to display symbol (index 0 is empty)
+        self.symbols = [" "]
+
+    def add_symbol(self, symbol):
+        self.symbols.append(symbol)
+        return len(self.symbols) - 1
 
     def display(self):
-        print("\n" + "-" * (self.size * 4))
-        for row in self.grid:
-            print(" | ".join(row))
-            print("-" * (self.size * 4))
-
-    def update_cell(self, row, col, symbol):
-        if self.grid[row][col] == " ":
-            self.grid[row][col] = symbol
+        # Build the whole frame first so it goes out in a single write
+        sep = "-" * (self.size * 4)
+        lines = [sep]
+        for start in range(0, len(self.grid), self.size):
+            row = self.grid[start:start + self.size]
+            lines.append(" | ".join(self.symbols[code] for code in row))
+            lines.append(sep)
+        sys.stdout.write("\n" + "\n".join(lines) + "\n")
+
+    def update_cell(self, row, col, code):
+        i = row * self.size + col
+        if self.grid[i] == 0:
+            self.grid[i] = code
             return True
         return False
 
     def is_full(self):
-        return all(cell != " " for row in self.grid for cell in row)
+        return 0 not in self.grid
 
 
 class Game:
     def __init__(self):
         self.players = []
         self.board = None
+        # Marks per player on each line: rows, then columns, then both diagonals
+        self.counts = None
 
     def setup_game(self):
         # Board size selection
@@ -55,31 +73,27 @@ class Game:
                     used_symbols.add(symbol)
                     break
 
-            self.players.append(Player(name, symbol))
-
-    def check_win(self, symbol):
-        size = self.board.size
-        g = self.board.grid
-
-        # Check rows
-        for row in g:
-            if all(cell == symbol for cell in row):
-                return True
+            code = self.board.add_symbol(symbol)
+            self.players.append(Player(name, symbol, code))
 
-        # Check columns
-        for col in range(size):
-            if all(g[row][col] == symbol for row in range(size)):
-                return True
+        self.counts = [[0] * (2 * size + 2) for _ in range(num_players)]
 
-        # Check main diagonal
-        if all(g[i][i] == symbol for i in range(size)):
-            return True
-
-        # Check anti-diagonal
-        if all(g[i][size - 1 - i] == symbol for i in range(size)):
-            return True
-
-        return False
+    def record_move(self, player, row, col):
+        size = self.board.size
+        lines = [row, size + col]
+        if row == col:
+            lines.append(2 * size)
+        if row + col == size - 1:
+            lines.append(2 * size + 1)
+
+        # Only the lines through the new mark can have just been completed
+        counts = self.counts[player.code - 1]
+        won = False
+        for line in lines:
+            counts[line] += 1
+            if counts[line] == size:
+                won = True
+        return won
 
     def play(self):
         self.setup_game()
@@ -99,7 +113,7 @@ class Game:
                     print("Invalid move! Position out of range.")
                     continue
 
-                if not self.board.update_cell(row, col, current_player.symbol):
+                if not self.board.update_cell(row, col, current_player.code):
                     print("Cell already occupied! Try another move.")
                     continue
             except ValueError:
@@ -107,7 +121,7 @@ class Game:
                 continue
 
             # Check win
-            if self.check_win(current_player.symbol):
+            if self.record_move(current_player, row, col):
                 self.board.display()
                 print(f"\n🎉 {current_player.name} wins!")
                 break